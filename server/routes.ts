@@ -27,6 +27,7 @@ import { jobProcessor } from './utils/job-processor';
 import { redisService } from './services/redis';
 import { healthCheckHandler, simpleHealthHandler, readinessHandler } from './utils/health-check';
 import { logger } from './utils/logger';
+import { sha256File } from './utils/file-hash';
 
 // Helper functions for tech stack processing
 interface TechStackData {
@@ -424,7 +425,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       // Page count: computed client-side today; placeholder null
       // Thumbnails placeholder lookup
       const { enhancedRedisService } = await import('./services/enhanced-redis-service');
-      const hash = (await import('crypto')).createHash('sha256').update(await (await import('fs/promises')).readFile(filePath)).digest('hex');
+      const hash = await sha256File(filePath);
       const thumbs = await enhancedRedisService.get(`thumbs:${hash}`, 'files');
       res.json({ fileSize: stat.size, updatedAt: resume.updatedAt, pageCount: thumbs?.pages ?? null, thumbnailsReady: !!thumbs?.ready });
     } catch (e) {
@@ -445,10 +446,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       if (images.length === 0) return res.status(400).json({ message: 'images[] required (data URLs)' });
 
       const filePath = path.resolve(process.cwd(), resume.originalPath!);
-      const fs = await import('fs/promises');
-      const crypto = await import('crypto');
-      const buf = await fs.readFile(filePath);
-      const hash = crypto.createHash('sha256').update(buf).digest('hex');
+      const hash = await sha256File(filePath);
 
       const { enhancedRedisService } = await import('./services/enhanced-redis-service');
       await enhancedRedisService.set(`thumbs:${hash}`, { ready: true, pages: images.length, images }, { ttl: 86400, namespace: 'files', compress: true });
@@ -468,17 +466,15 @@ export async function registerRoutes(app: Express): Promise<Server> {
       if (resume.userId !== userId) return res.status(403).json({ message: 'Access denied' });
 
       const filePath = path.resolve(process.cwd(), resume.originalPath!);
-      const fs = await import('fs/promises');
-      const crypto = await import('crypto');
-      const buf = await fs.readFile(filePath);
-      const hash = crypto.createHash('sha256').update(buf).digest('hex');
+      const hash = await sha256File(filePath);
 
       const { enhancedRedisService } = await import('./services/enhanced-redis-service');
       let thumbs = await enhancedRedisService.get(`thumbs:${hash}`, 'files');
       if (!thumbs) {
-        // Attempt lightweight server-side first-page preview
+        // Attempt lightweight server-side first-page preview (only now do we need the bytes)
         try {
           const { generateDocxFirstPageThumbnail } = await import('./utils/docx-thumbnail');
+          const buf = await fsp.readFile(filePath);
           const preview = await generateDocxFirstPageThumbnail(buf);
           if (preview) {
             thumbs = { ready: false, pages: 1, images: [preview] };
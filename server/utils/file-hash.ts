@@ -0,0 +1,16 @@
+import { createHash } from 'crypto';
+import { createReadStream } from 'fs';
+
+/**
+ * Compute the SHA-256 hex digest of a file by streaming it through the hasher,
+ * so the whole file never has to be held in memory.
+ */
+export function sha256File(filePath: string): Promise<string> {
+  return new Promise((resolve, reject) => {
+    const hash = createHash('sha256');
+    createReadStream(filePath, { highWaterMark: 64 * 1024 })
+      .on('data', (chunk) => hash.update(chunk))
+      .on('end', () => resolve(hash.digest('hex')))
+      .on('error', reject);
+  });
+}
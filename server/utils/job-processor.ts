@@ -554,13 +554,13 @@ export const registerBuiltInProcessors = () => {
       const filePath = path.resolve(process.cwd(), resume.originalPath);
       
       try {
-        const fileBuffer = await fs.readFile(filePath);
+        const stat = await fs.stat(filePath);
         // Mark ready
         await storage.updateResumeStatus(resumeId, "ready");
         // Precompute first-page thumbnail placeholder (defer heavy image ops to client)
         try {
-          const crypto = await import('crypto');
-          const hash = crypto.createHash('sha256').update(fileBuffer).digest('hex');
+          const { sha256File } = await import('./file-hash');
+          const hash = await sha256File(filePath);
           const { enhancedRedisService } = await import('../services/enhanced-redis-service');
           // If not already present, store a marker so client knows server expects thumbnails
           const existing = await enhancedRedisService.get(`thumbs:${hash}`, 'files');
@@ -571,7 +571,7 @@ export const registerBuiltInProcessors = () => {
         logger.info(`✅ Resume ${resumeId} marked as ready for SuperDoc editing`);
         return {
           success: true,
-          result: { message: 'Resume ready for SuperDoc editing', resumeId, userId, fileSize: fileBuffer.length },
+          result: { message: 'Resume ready for SuperDoc editing', resumeId, userId, fileSize: stat.size },
           processingTime: performance.now() - startTime
         };
       } catch (fileError) {